@@ -11,7 +11,11 @@ from sktime.distances._ddtw import DerivativeCallable, _DdtwDistance, average_of
 from sktime.distances._dtw import _DtwDistance
 from sktime.distances._edr import _EdrDistance
 from sktime.distances._erp import _ErpDistance
-from sktime.distances._euclidean import _EuclideanDistance
+from sktime.distances._euclidean import (
+    _EuclideanDistance,
+    _numba_euclidean_distance,
+    _pairwise_euclidean_distance,
+)
 from sktime.distances._lcss import _LcssDistance
 from sktime.distances._msm import _MsmDistance
 from sktime.distances._numba_utils import (
@@ -944,11 +948,6 @@ def euclidean_distance(x: np.ndarray, y: np.ndarray, **kwargs: Any) -> float:
     ValueError
         If the value of x or y provided is not a numpy array.
         If the value of x or y has more than 2 dimensions.
-        If a metric string provided, and is not a defined valid string.
-        If a metric object (instance of class) is provided and doesn't inherit from
-        NumbaDistance.
-        If a resolved metric is not no_python compiled.
-        If the metric type cannot be determined.
 
     Examples
     --------
@@ -963,7 +962,11 @@ def euclidean_distance(x: np.ndarray, y: np.ndarray, **kwargs: Any) -> float:
     >>> euclidean_distance(x_2d, y_2d)
     22.627416997969522
     """
-    return distance(x, y, metric="euclidean", **kwargs)
+    # Euclidean has no parameters to resolve and does not modify its input, so the
+    # series are passed straight to the numba kernel without copies.
+    _x = to_numba_timeseries(x, copy=False)
+    _y = to_numba_timeseries(y, copy=False)
+    return _numba_euclidean_distance(_x, _y)
 
 
 def dtw_alignment_path(
@@ -2051,10 +2054,13 @@ def pairwise_distance(
     if y is None:
         y = x
     _y = _make_3d_series(y)
-    symmetric = np.array_equal(_x, _y)
+    # the same array is trivially symmetric, which skips comparing every value
+    symmetric = y is x or np.array_equal(_x, _y)
     _metric_callable = _resolve_metric_to_factory(
         metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
     )
+    if _metric_callable is _numba_euclidean_distance:
+        return _pairwise_euclidean_distance(_x, _y, symmetric)
     return _compute_pairwise_distance(_x, _y, symmetric, _metric_callable)
 
 
@@ -9,6 +9,18 @@ from numba import njit
 
 from sktime.distances.base import DistanceCallable, NumbaDistance
 
+# Below this many multiply-adds (pairs * values per series) the direct numba kernel
+# beats the matrix product, whose cost is then dominated by numpy call overhead.
+_PAIRWISE_DIRECT_MAX_WORK = 2**15
+# Tile sizes for the direct pairwise kernel: rows of x, rows of y and values per
+# series processed together so that the working set stays in L1/L2 cache.
+_BLOCK_X = 64
+_BLOCK_Y = 64
+_BLOCK_VALUES = 256
+# Above this many multiply-adds the pairwise matrix is computed on a CUDA GPU, when one
+# is available, as the kernel then outweighs copying the series to the device.
+_PAIRWISE_CUDA_MIN_WORK = 2**28
+
 
 class _EuclideanDistance(NumbaDistance):
     """Euclidean distance between two time series."""
@@ -79,9 +91,164 @@ def _numba_euclidean_distance(x: np.ndarray, y: np.ndarray) -> float:
     distance: float
         Euclidean distance between x and y.
     """
+    if x.flags.c_contiguous and y.flags.c_contiguous:
+        # Flattened views let the single scalar loop vectorise across dimensions
+        # without allocating any temporaries.
+        return _local_euclidean_distance(x.ravel(), y.ravel())
+
     distance = 0.0
     for i in range(x.shape[0]):
         for j in range(x.shape[1]):
-            difference = x[i][j] - y[i][j]
+            difference = x[i, j] - y[i, j]
             distance += difference * difference
     return np.sqrt(distance)
+
+
+# Compile the signatures distance and euclidean_distance produce up front, so the first
+# call does not pay for JIT compilation. Both convert their input to float64, which is
+# contiguous unless a non-contiguous float64 array is passed to euclidean_distance.
+# Loaded from the on disk cache after the first import, other types still compile
+# lazily on first use.
+for _signature in [
+    "float64(float64[:, ::1], float64[:, ::1])",
+    "float64(float64[:, :], float64[:, :])",
+]:
+    _numba_euclidean_distance.compile(_signature)
+
+
+def _pairwise_euclidean_distance(
+    x: np.ndarray, y: np.ndarray, symmetric: bool
+) -> np.ndarray:
+    """Compute the pairwise euclidean distance matrix between two sets of series.
+
+    Each series is flattened to a vector of d*m values, the values are centred and
+    the squared distances are expanded as ||x||^2 + ||y||^2 - 2 * x.y, so the bulk of
+    the work is a single matrix product handed to BLAS rather than m*n calls to the
+    numba kernel. Small problems, where the matrix product does not pay for itself,
+    are computed directly by a cache blocked numba kernel, and very large ones by a
+    CUDA kernel if a GPU is available.
+
+    Parameters
+    ----------
+    x: np.ndarray (3d array of shape (m, d, l))
+        First set of time series.
+    y: np.ndarray (3d array of shape (n, d, l))
+        Second set of time series.
+    symmetric: bool
+        Boolean that is true when x and y hold the same series. The squared norms
+        and the matrix product are then only computed for x and the diagonal is
+        set to exactly zero.
+
+    Returns
+    -------
+    np.ndarray (2d of size mxn where m is len(x) and n is len(y)).
+        Pairwise euclidean distance matrix between the two sets of time series.
+    """
+    # The series are flattened into contiguous rows once, so the kernels read them
+    # with unit stride. float32 input stays float32 for the direct numba and CUDA
+    # kernels, which halves their memory traffic, and both sum the squared
+    # differences in float64.
+    dtype = np.result_type(x.dtype, y.dtype, np.float32)
+    _x = np.ascontiguousarray(x.reshape((x.shape[0], -1)), dtype=dtype)
+    if symmetric:
+        _y = _x
+    else:
+        _y = np.ascontiguousarray(y.reshape((y.shape[0], -1)), dtype=dtype)
+
+    work = _x.shape[0] * _y.shape[0] * _x.shape[1]
+    if work <= _PAIRWISE_DIRECT_MAX_WORK:
+        return _numba_pairwise_euclidean_distance(_x, _y, symmetric)
+    if work >= _PAIRWISE_CUDA_MIN_WORK:
+        # numba.cuda is only imported once a problem is large enough to use it
+        from numba import cuda
+
+        if cuda.is_available():
+            from sktime.distances._euclidean_cuda import (
+                _cuda_pairwise_euclidean_distance,
+            )
+
+            return _cuda_pairwise_euclidean_distance(_x, _y, symmetric)
+
+    # Euclidean distance is translation invariant. Centring both sets on the mean of
+    # y removes any offset the series share, which would otherwise cancel out of the
+    # expansion and take most of the precision with it. The expansion is computed in
+    # float64 whatever the input, as even centred float32 series can lose all the
+    # digits of small distances between series with different offsets.
+    mean = _y.mean(axis=0, dtype=np.float64)
+    _x = _x - mean
+    if symmetric:
+        _y = _x
+    else:
+        _y = _y - mean
+
+    x_sq_norms = np.einsum("ij,ij->i", _x, _x)
+    distances = _x @ _y.T
+    distances *= -2.0
+    if symmetric:
+        # x @ x.T is symmetric, adding both norms in one sum keeps the result
+        # exactly symmetric where two separate additions would round differently.
+        distances += x_sq_norms[:, np.newaxis] + x_sq_norms[np.newaxis, :]
+    else:
+        y_sq_norms = np.einsum("ij,ij->i", _y, _y)
+        distances += x_sq_norms[:, np.newaxis]
+        distances += y_sq_norms[np.newaxis, :]
+    # Rounding in the expansion can leave tiny negative values for near
+    # identical series.
+    np.maximum(distances, 0.0, out=distances)
+    if symmetric:
+        np.fill_diagonal(distances, 0.0)
+    return np.sqrt(distances, out=distances)
+
+
+@njit(cache=True, fastmath=True)
+def _numba_pairwise_euclidean_distance(
+    x: np.ndarray, y: np.ndarray, symmetric: bool
+) -> np.ndarray:
+    """Compute the pairwise euclidean distance matrix with a cache blocked loop.
+
+    The output is computed in tiles of _BLOCK_X by _BLOCK_Y pairs, accumulating
+    _BLOCK_VALUES values of each series at a time, so each loaded row of x is reused
+    across a whole tile of y.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape (m, k))
+        First set of flattened time series.
+    y: np.ndarray (2d array of shape (n, k))
+        Second set of flattened time series.
+    symmetric: bool
+        Boolean that is true when x and y hold the same series. Only the pairs
+        above the diagonal are then computed and mirrored below it.
+
+    Returns
+    -------
+    np.ndarray (2d of size mxn where m is len(x) and n is len(y)).
+        Pairwise euclidean distance matrix between the two sets of time series.
+    """
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+    n_values = x.shape[1]
+    distances = np.zeros((x_size, y_size), dtype=np.float64)
+
+    for i_start in range(0, x_size, _BLOCK_X):
+        i_end = min(i_start + _BLOCK_X, x_size)
+        for j_start in range(i_start if symmetric else 0, y_size, _BLOCK_Y):
+            j_end = min(j_start + _BLOCK_Y, y_size)
+            for k_start in range(0, n_values, _BLOCK_VALUES):
+                k_end = min(k_start + _BLOCK_VALUES, n_values)
+                for i in range(i_start, i_end):
+                    for j in range(
+                        max(j_start, i + 1) if symmetric else j_start, j_end
+                    ):
+                        distance = 0.0
+                        for k in range(k_start, k_end):
+                            difference = x[i, k] - y[j, k]
+                            distance += difference * difference
+                        distances[i, j] += distance
+
+    if symmetric:
+        for i in range(x_size):
+            for j in range(i + 1, y_size):
+                distances[j, i] = distances[i, j]
+
+    return np.sqrt(distances)
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Euclidean pairwise distance on a CUDA GPU.
+
+Kept apart from the euclidean module so that numba.cuda is only imported for
+problems large enough to be computed on a GPU.
+"""
+__author__ = ["chrisholder", "TonyBagnall"]
+
+import math
+from functools import lru_cache
+
+import numpy as np
+from numba import cuda, float64, from_dtype
+
+# Width of the square thread blocks, and of the shared memory tiles, of the CUDA kernel.
+_CUDA_TILE = 16
+
+
+def _cuda_pairwise_euclidean_distance(
+    x: np.ndarray, y: np.ndarray, symmetric: bool
+) -> np.ndarray:
+    """Compute the pairwise euclidean distance matrix on a CUDA GPU.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape (m, k))
+        First set of flattened time series.
+    y: np.ndarray (2d array of shape (n, k))
+        Second set of flattened time series, of the same dtype as x.
+    symmetric: bool
+        Boolean that is true when x and y hold the same series. Only the tiles on
+        and above the diagonal are then computed and mirrored below it.
+
+    Returns
+    -------
+    np.ndarray (2d of size mxn where m is len(x) and n is len(y)).
+        Pairwise euclidean distance matrix between the two sets of time series.
+    """
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+    distances = cuda.device_array((x_size, y_size), dtype=np.float64)
+    blocks = (
+        (y_size + _CUDA_TILE - 1) // _CUDA_TILE,
+        (x_size + _CUDA_TILE - 1) // _CUDA_TILE,
+    )
+    d_x = cuda.to_device(x)
+    d_y = d_x if symmetric else cuda.to_device(y)
+    kernel = _make_cuda_pairwise_euclidean_kernel(x.dtype)
+    kernel[blocks, (_CUDA_TILE, _CUDA_TILE)](d_x, d_y, symmetric, distances)
+    return distances.copy_to_host()
+
+
+@lru_cache(maxsize=None)
+def _make_cuda_pairwise_euclidean_kernel(dtype: np.dtype):
+    """Create the CUDA pairwise euclidean kernel for series of a given dtype.
+
+    The kernel is created on first use for each dtype and compiled on its first
+    launch. Shared memory tiles are of the dtype of the series, so float32 series
+    take half the shared memory and bandwidth, while the squared differences are
+    summed in float64, as in the numba kernels.
+
+    Parameters
+    ----------
+    dtype: np.dtype
+        Type of the values of the series, float32 or float64.
+
+    Returns
+    -------
+    CUDA kernel
+        Kernel taking x, y, symmetric and the output distance matrix.
+    """
+    tile_dtype = from_dtype(dtype)
+
+    @cuda.jit
+    def _cuda_pairwise_euclidean_kernel(x, y, symmetric, distances):
+        """CUDA kernel computing one euclidean distance per thread.
+
+        Each block of _CUDA_TILE by _CUDA_TILE threads computes a tile of the
+        distance matrix, with threadIdx.y along the rows of x and threadIdx.x along
+        the rows of y. The values of its rows of x and y are staged through shared
+        memory _CUDA_TILE at a time, so each value is read from global memory once
+        per block rather than once per thread.
+
+        Parameters
+        ----------
+        x: device array (2d array of shape (m, k))
+            First set of flattened time series.
+        y: device array (2d array of shape (n, k))
+            Second set of flattened time series.
+        symmetric: bool
+            Boolean that is true when x and y hold the same series.
+        distances: device array (2d array of shape (m, n))
+            Output pairwise distance matrix.
+        """
+        # Tiles below the diagonal of a symmetric matrix are mirrored from above it.
+        if symmetric and cuda.blockIdx.x < cuda.blockIdx.y:
+            return
+
+        # Rows are padded by one value, so the threads of a warp reading down a
+        # column of y_tile hit different shared memory banks.
+        x_tile = cuda.shared.array((_CUDA_TILE, _CUDA_TILE + 1), tile_dtype)
+        y_tile = cuda.shared.array((_CUDA_TILE, _CUDA_TILE + 1), tile_dtype)
+        tx = cuda.threadIdx.x
+        ty = cuda.threadIdx.y
+        x_start = cuda.blockIdx.y * _CUDA_TILE
+        y_start = cuda.blockIdx.x * _CUDA_TILE
+        n_values = x.shape[1]
+
+        distance = float64(0.0)
+        for k_start in range(0, n_values, _CUDA_TILE):
+            # threadIdx.x steps along the values of a series, so neighbouring
+            # threads load neighbouring values and the reads are coalesced. Values
+            # past the end of the series are staged as zero on both sides, so they
+            # add nothing to the distance.
+            k = k_start + tx
+            if x_start + ty < x.shape[0] and k < n_values:
+                x_tile[ty, tx] = x[x_start + ty, k]
+            else:
+                x_tile[ty, tx] = 0.0
+            if y_start + ty < y.shape[0] and k < n_values:
+                y_tile[ty, tx] = y[y_start + ty, k]
+            else:
+                y_tile[ty, tx] = 0.0
+            cuda.syncthreads()
+
+            for k in range(_CUDA_TILE):
+                difference = float64(x_tile[ty, k] - y_tile[tx, k])
+                distance += difference * difference
+            cuda.syncthreads()
+
+        i = x_start + ty
+        j = y_start + tx
+        if i < x.shape[0] and j < y.shape[0]:
+            distance = math.sqrt(distance)
+            distances[i, j] = distance
+            if symmetric:
+                distances[j, i] = distance
+
+    return _cuda_pairwise_euclidean_kernel
@@ -125,13 +125,16 @@ def is_no_python_compiled_callable(
     return is_no_python_callable
 
 
-def to_numba_timeseries(x: np.ndarray) -> np.ndarray:
+def to_numba_timeseries(x: np.ndarray, copy: bool = True) -> np.ndarray:
     """Convert a time series to a valid time series for numba use.
 
     Parameters
     ----------
     x: np.ndarray (1d or 2d)
         A time series.
+    copy: bool, defaults = True
+        Boolean that when False returns a view of x where possible, only copying
+        it if it is not already a float64 array.
 
     Returns
     -------
@@ -150,7 +153,7 @@ def to_numba_timeseries(x: np.ndarray) -> np.ndarray:
             f"distance computation a numpy array must be provided."
         )
 
-    _x = np.array(x, copy=True, dtype=float)
+    _x = np.array(x, copy=True, dtype=float) if copy else np.asarray(x, dtype=float)
     num_dims = _x.ndim
     shape = _x.shape
     if num_dims == 1 or (num_dims == 2 and _x.shape[1] == 1 and _x.shape[0] != 1):
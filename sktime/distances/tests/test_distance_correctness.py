@@ -6,7 +6,9 @@ results generated with tsml, in distances.tests.TestDistances.
 """
 __author__ = ["chrisholder", "TonyBagnall"]
 
+import numpy as np
 from numpy.testing import assert_almost_equal
+from scipy.spatial.distance import cdist, euclidean
 
 from sktime.datasets import load_basic_motions, load_unit_test
 from sktime.distances import (
@@ -17,6 +19,7 @@ from sktime.distances import (
     euclidean_distance,
     lcss_distance,
     msm_distance,
+    pairwise_distance,
     twe_distance,
     wddtw_distance,
     wdtw_distance,
@@ -151,3 +154,38 @@ def test_univariate_correctness():
         twe_uni.append(d)
         assert_almost_equal(d, unit_test_distances["twe"][j], 4)
         assert d == d2
+
+
+def test_euclidean_correctness():
+    """Test euclidean is a single sqrt of the summed squares, as in scipy."""
+    trainX, trainy = load_basic_motions(return_type="numpy3D")
+    # 1D and 2D (d,m) series are compared over all their values at once
+    d = euclidean_distance(trainX[0, 0], trainX[1, 0])
+    assert_almost_equal(d, euclidean(trainX[0, 0], trainX[1, 0]))
+    d = euclidean_distance(trainX[0], trainX[1])
+    assert_almost_equal(d, euclidean(trainX[0].ravel(), trainX[1].ravel()))
+    # 3D panels give the pairwise matrix over flattened instances, both for small
+    # panels and for panels large enough to use the matrix product
+    for X, X2 in [(trainX[:5], trainX[5:8]), (trainX, trainX[::-1])]:
+        expected = cdist(X.reshape(len(X), -1), X2.reshape(len(X2), -1))
+        d = pairwise_distance(X, X2, metric="euclidean")
+        assert_almost_equal(d, expected, 4)
+    # series sharing a large offset, relative to their differences, must not lose
+    # precision to cancellation in the matrix product
+    rng = np.random.RandomState(0)
+    X = 1000 + rng.normal(scale=1e-3, size=(100, 1, 500))
+    X2 = 1000 + rng.normal(scale=1e-3, size=(80, 1, 500))
+    for X2 in [X, X2]:
+        expected = cdist(X.reshape(len(X), -1), X2.reshape(len(X2), -1))
+        d = pairwise_distance(X, X2, metric="euclidean")
+        assert_almost_equal(d, expected, 10)
+    # float32 panels give float64 distances as accurate as the float32 values allow,
+    # both below and above the size where the matrix product is used
+    X = X.astype(np.float32)
+    for X1, X2 in [(X[:10, :, :100], X[10:20, :, :100]), (X, X[::-1])]:
+        expected = cdist(
+            X1.reshape(len(X1), -1).astype(float), X2.reshape(len(X2), -1).astype(float)
+        )
+        d = pairwise_distance(X1, X2, metric="euclidean")
+        assert d.dtype == np.float64
+        assert_almost_equal(d, expected, 6)
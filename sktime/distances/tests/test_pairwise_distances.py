@@ -3,6 +3,9 @@
 
 __author__ = ["chrisholder"]
 
+import os
+import subprocess
+import sys
 from typing import Callable
 
 import numpy as np
@@ -277,3 +280,36 @@ def test_metric_parameters():
 def test_incorrect_parameters():
     """Ensure incorrect parameters raise errors."""
     _test_incorrect_parameters(pairwise_distance)
+
+
+_CUDA_SIMULATOR_SCRIPT = """
+import numpy as np
+from numpy.testing import assert_almost_equal
+from scipy.spatial.distance import cdist
+
+from sktime.distances._euclidean_cuda import _cuda_pairwise_euclidean_distance
+
+rng = np.random.RandomState(0)
+for dtype in [np.float32, np.float64]:
+    x = rng.normal(size=(20, 37)).astype(dtype)
+    y = rng.normal(size=(18, 37)).astype(dtype)
+    for y, symmetric in [(y, False), (x, True)]:
+        d = _cuda_pairwise_euclidean_distance(x, y, symmetric)
+        assert_almost_equal(d, cdist(x.astype(float), y.astype(float)), 5)
+    assert np.array_equal(d, d.T)
+# squared differences of float32 series are summed in float64, as on the CPU
+x = rng.normal(size=(20, 500)).astype(np.float32)
+y = np.ascontiguousarray(x[::-1])
+d = _cuda_pairwise_euclidean_distance(x, y, False)
+assert_almost_equal(d, cdist(x.astype(float), y.astype(float)), 6)
+"""
+
+
+def test_cuda_pairwise_euclidean_distance():
+    """Ensure the CUDA pairwise euclidean kernel is correct, on the CUDA simulator.
+
+    The simulator is only enabled when numba is imported, so the kernel is run in a
+    separate process.
+    """
+    env = dict(os.environ, NUMBA_ENABLE_CUDASIM="1")
+    subprocess.run([sys.executable, "-c", _CUDA_SIMULATOR_SCRIPT], env=env, check=True)
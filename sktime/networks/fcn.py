@@ -66,17 +66,21 @@ class FCNNetwork(BaseDeepNetwork):
 
         input_layer = keras.layers.Input(input_shape)
 
-        conv1 = keras.layers.Conv1D(filters=128, kernel_size=8, padding="same")(
-            input_layer
-        )
+        conv1 = keras.layers.Conv1D(
+            filters=128, kernel_size=8, padding="same", use_bias=False
+        )(input_layer)
         conv1 = keras.layers.BatchNormalization()(conv1)
         conv1 = keras.layers.Activation(activation="relu")(conv1)
 
-        conv2 = keras.layers.Conv1D(filters=256, kernel_size=5, padding="same")(conv1)
+        conv2 = keras.layers.Conv1D(
+            filters=256, kernel_size=5, padding="same", use_bias=False
+        )(conv1)
         conv2 = keras.layers.BatchNormalization()(conv2)
         conv2 = keras.layers.Activation(activation="relu")(conv2)
 
-        conv3 = keras.layers.Conv1D(filters=128, kernel_size=3, padding="same")(conv2)
+        conv3 = keras.layers.Conv1D(
+            filters=128, kernel_size=3, padding="same", use_bias=False
+        )(conv2)
         conv3 = keras.layers.BatchNormalization()(conv3)
         conv3 = keras.layers.Activation(activation="relu")(conv3)
 
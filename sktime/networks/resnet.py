@@ -69,25 +69,25 @@ class ResNetNetwork(BaseDeepNetwork):
         # 1st residual block
 
         conv_x = keras.layers.Conv1D(
-            filters=n_feature_maps, kernel_size=8, padding="same"
+            filters=n_feature_maps, kernel_size=8, padding="same", use_bias=False
         )(input_layer)
         conv_x = keras.layers.BatchNormalization()(conv_x)
         conv_x = keras.layers.Activation("relu")(conv_x)
 
         conv_y = keras.layers.Conv1D(
-            filters=n_feature_maps, kernel_size=5, padding="same"
+            filters=n_feature_maps, kernel_size=5, padding="same", use_bias=False
         )(conv_x)
         conv_y = keras.layers.BatchNormalization()(conv_y)
         conv_y = keras.layers.Activation("relu")(conv_y)
 
         conv_z = keras.layers.Conv1D(
-            filters=n_feature_maps, kernel_size=3, padding="same"
+            filters=n_feature_maps, kernel_size=3, padding="same", use_bias=False
         )(conv_y)
         conv_z = keras.layers.BatchNormalization()(conv_z)
 
         # expand channels for the sum
         shortcut_y = keras.layers.Conv1D(
-            filters=n_feature_maps, kernel_size=1, padding="same"
+            filters=n_feature_maps, kernel_size=1, padding="same", use_bias=False
         )(input_layer)
         shortcut_y = keras.layers.BatchNormalization()(shortcut_y)
 
@@ -97,25 +97,25 @@ class ResNetNetwork(BaseDeepNetwork):
         # 2nd residual block
 
         conv_x = keras.layers.Conv1D(
-            filters=n_feature_maps * 2, kernel_size=8, padding="same"
+            filters=n_feature_maps * 2, kernel_size=8, padding="same", use_bias=False
         )(output_block_1)
         conv_x = keras.layers.BatchNormalization()(conv_x)
         conv_x = keras.layers.Activation("relu")(conv_x)
 
         conv_y = keras.layers.Conv1D(
-            filters=n_feature_maps * 2, kernel_size=5, padding="same"
+            filters=n_feature_maps * 2, kernel_size=5, padding="same", use_bias=False
         )(conv_x)
         conv_y = keras.layers.BatchNormalization()(conv_y)
         conv_y = keras.layers.Activation("relu")(conv_y)
 
         conv_z = keras.layers.Conv1D(
-            filters=n_feature_maps * 2, kernel_size=3, padding="same"
+            filters=n_feature_maps * 2, kernel_size=3, padding="same", use_bias=False
         )(conv_y)
         conv_z = keras.layers.BatchNormalization()(conv_z)
 
         # expand channels for the sum
         shortcut_y = keras.layers.Conv1D(
-            filters=n_feature_maps * 2, kernel_size=1, padding="same"
+            filters=n_feature_maps * 2, kernel_size=1, padding="same", use_bias=False
         )(output_block_1)
         shortcut_y = keras.layers.BatchNormalization()(shortcut_y)
 
@@ -125,19 +125,19 @@ class ResNetNetwork(BaseDeepNetwork):
         # 3rd residual block
 
         conv_x = keras.layers.Conv1D(
-            filters=n_feature_maps * 2, kernel_size=8, padding="same"
+            filters=n_feature_maps * 2, kernel_size=8, padding="same", use_bias=False
         )(output_block_2)
         conv_x = keras.layers.BatchNormalization()(conv_x)
         conv_x = keras.layers.Activation("relu")(conv_x)
 
         conv_y = keras.layers.Conv1D(
-            filters=n_feature_maps * 2, kernel_size=5, padding="same"
+            filters=n_feature_maps * 2, kernel_size=5, padding="same", use_bias=False
         )(conv_x)
         conv_y = keras.layers.BatchNormalization()(conv_y)
         conv_y = keras.layers.Activation("relu")(conv_y)
 
         conv_z = keras.layers.Conv1D(
-            filters=n_feature_maps * 2, kernel_size=3, padding="same"
+            filters=n_feature_maps * 2, kernel_size=3, padding="same", use_bias=False
         )(conv_y)
         conv_z = keras.layers.BatchNormalization()(conv_z)
 
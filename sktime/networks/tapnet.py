@@ -221,6 +221,7 @@ class TapNetNetwork(BaseDeepNetwork):
                         dilation_rate=self.dilation,
                         strides=1,
                         padding=self.padding,
+                        use_bias=False,
                     )(
                         channel
                     )  # N * C * L
@@ -234,6 +235,7 @@ class TapNetNetwork(BaseDeepNetwork):
                         dilation_rate=self.dilation,
                         strides=1,
                         padding=self.padding,
+                        use_bias=False,
                     )(x_conv)
                     x_conv = keras.layers.BatchNormalization()(x_conv)
                     x_conv = keras.layers.LeakyReLU()(x_conv)
@@ -244,6 +246,7 @@ class TapNetNetwork(BaseDeepNetwork):
                         dilation_rate=self.dilation,
                         strides=1,
                         padding=self.padding,
+                        use_bias=False,
                     )(x_conv)
                     x_conv = keras.layers.BatchNormalization()(x_conv)
                     x_conv = keras.layers.LeakyReLU()(x_conv)
@@ -270,6 +273,7 @@ class TapNetNetwork(BaseDeepNetwork):
                     dilation_rate=self.dilation,
                     strides=1,
                     padding=self.padding,
+                    use_bias=False,
                 )(
                     input_layer
                 )  # N * C * L
@@ -283,6 +287,7 @@ class TapNetNetwork(BaseDeepNetwork):
                     dilation_rate=self.dilation,
                     strides=1,
                     padding=self.padding,
+                    use_bias=False,
                 )(x_conv)
                 x_conv = keras.layers.BatchNormalization()(x_conv)
                 x_conv = keras.layers.LeakyReLU()(x_conv)
@@ -293,6 +298,7 @@ class TapNetNetwork(BaseDeepNetwork):
                     dilation_rate=self.dilation,
                     strides=1,
                     padding=self.padding,
+                    use_bias=False,
                 )(x_conv)
                 x_conv = keras.layers.BatchNormalization()(x_conv)
                 x_conv = keras.layers.LeakyReLU()(x_conv)